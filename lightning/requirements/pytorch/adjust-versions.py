@@ -1,7 +1,9 @@
 import os
 import re
 import sys
-from typing import Dict, Optional
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, Optional, Tuple
 
 # IMPORTANT: this list needs to be sorted in reverse
 VERSIONS = [
@@ -15,37 +17,73 @@ VERSIONS = [
     dict(torch="1.10.1", torchvision="0.11.2"),
     dict(torch="1.10.0", torchvision="0.11.1"),
 ]
+# compile the patterns once instead of on every call, requirements are plain ASCII so skip the unicode matching
+# the files are read in text mode so line endings are always normalized to "\n"
+_COMMENT_RE = re.compile(r"\s*#.*\n", re.ASCII)
+_ALL_LIBS_RE = re.compile(r"\b(" + "|".join(map(re.escape, VERSIONS[0])) + r")(?!\w).*", re.ASCII)
+_TORCH_VERSION_RE = re.compile(r"""^__version__\s*=\s*['"]([^'"]+)['"]""", re.ASCII | re.MULTILINE)
+# map each `major`, `major.minor` and `major.minor.patch` prefix to its latest option, the first one in the list wins
+# the keys are integer tuples so that e.g. "1.1" can't match "1.10.0"
+_BY_PREFIX: Dict[Tuple[int, ...], Dict[str, str]] = {}
+for _option in VERSIONS:
+    _parts = tuple(int(p) for p in _option["torch"].split("."))
+    for _i in range(1, len(_parts) + 1):
+        _BY_PREFIX.setdefault(_parts[:_i], _option)
 
 
+@lru_cache(maxsize=32)
 def find_latest(ver: str) -> Dict[str, str]:
-    # drop all except semantic version
-    ver = re.search(r"([\.\d]+)", ver).groups()[0]
+    # drop all except semantic version - the leading run of digits and dots
+    end = 0
+    while end < len(ver) and (ver[end].isdigit() or ver[end] == "."):
+        end += 1
     # in case there remaining dot at the end - e.g "1.9.0.dev20210504"
-    ver = ver[:-1] if ver[-1] == "." else ver
+    ver = ver[:end].rstrip(".")
     print(f"finding ecosystem versions for: {ver}")
 
     # find first match
-    for option in VERSIONS:
-        if option["torch"].startswith(ver):
-            return option
+    parts = ver.split(".")
+    option = _BY_PREFIX.get(tuple(int(p) for p in parts)) if all(parts) else None
+    if option is None:
+        raise ValueError(f"Missing {ver} in {VERSIONS}")
+    return option
 
-    raise ValueError(f"Missing {ver} in {VERSIONS}")
+
+def installed_torch_version() -> str:
+    # read the version from the generated `torch/version.py` as importing torch takes seconds
+    spec = find_spec("torch")
+    if spec is not None and spec.origin:
+        version_file = os.path.join(os.path.dirname(spec.origin), "version.py")
+        if os.path.isfile(version_file):
+            with open(version_file) as fp:
+                match = _TORCH_VERSION_RE.search(fp.read())
+            if match:
+                return match.group(1)
+    import torch
+
+    return torch.__version__
 
 
 def replace(req: str, torch_version: Optional[str] = None) -> str:
+    # pass the `torch_version` explicitly to skip looking up the installed one
     if not torch_version:
-        import torch
-
-        torch_version = torch.__version__
+        torch_version = installed_torch_version()
     assert torch_version, f"invalid torch: {torch_version}"
 
     # remove comments and strip whitespace
-    req = re.sub(rf"\s*#.*{os.linesep}", os.linesep, req).strip()
+    if "#" in req:
+        req = _COMMENT_RE.sub("\n", req)
+    req = req.strip()
 
     latest = find_latest(torch_version)
-    for lib, version in latest.items():
-        replace = f"{lib}=={version}" if version else ""
-        req = re.sub(rf"\b{lib}(?!\w).*", replace, req)
+
+    def _pin(match: re.Match) -> str:
+        lib = match.group(1)
+        version = latest.get(lib)
+        return f"{lib}=={version}" if version else ""
+
+    # substitute all the libraries in a single pass over the requirements
+    req = _ALL_LIBS_RE.sub(_pin, req)
 
     return req
 
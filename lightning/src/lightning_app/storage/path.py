@@ -385,8 +385,13 @@ def _shared_local_mount_path() -> pathlib.Path:
     return path.absolute()
 
 
+def _storage_root_path() -> pathlib.Path:
+    """Returns the location of the storage root directory without creating it."""
+    return pathlib.Path(os.environ.get("STORAGE_ROOT_DIR", "./.storage")).absolute()
+
+
 def _storage_root_dir() -> pathlib.Path:
-    path = pathlib.Path(os.environ.get("STORAGE_ROOT_DIR", "./.storage")).absolute()
+    path = _storage_root_path()
     path.mkdir(parents=True, exist_ok=True)
     return path
 
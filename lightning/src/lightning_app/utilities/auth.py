@@ -20,14 +20,13 @@ def _credential_string_to_basic_auth_params(credential_string: str) -> Dict[str,
 
     Raises a `ValueError` if any of the given Secret names do not exist.
     """
-    if credential_string.count(":") != 1:
+    username, sep, password = credential_string.partition(":")
+    if not sep or ":" in password:
         raise ValueError(
             "Credential string must follow the format username:password; "
             + f"the provided one ('{credential_string}') does not."
         )
 
-    username, password = credential_string.split(":")
-
     if not username:
         raise ValueError("Username cannot be empty.")
 
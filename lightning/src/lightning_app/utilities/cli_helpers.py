@@ -19,6 +19,7 @@ import re
 import shutil
 import subprocess
 import sys
+import time
 from typing import Dict, Optional
 
 import arrow
@@ -34,6 +35,10 @@ from lightning_app.utilities.network import LightningClient
 
 logger = Logger(__name__)
 
+_ENV_VARIABLE_NAME_RE = re.compile(r"[0-9a-zA-Z_]+", re.ASCII)
+# seconds before checking PyPI for a newer version again
+_NEWER_VERSION_TTL = 60 * 60
+
 
 def _format_input_env_variables(env_list: tuple) -> Dict[str, str]:
     """
@@ -49,18 +54,18 @@ def _format_input_env_variables(env_list: tuple) -> Dict[str, str]:
 
     env_vars_dict = {}
     for env_str in env_list:
-        var_parts = env_str.split("=")
-        if len(var_parts) != 2 or not var_parts[0]:
+        var_name, sep, value = env_str.partition("=")
+        if not sep or not var_name or "=" in value:
             raise Exception(
                 f"Invalid format of environment variable {env_str}, "
                 f"please ensure that the variable is in the format e.g. foo=bar."
             )
-        var_name, value = var_parts
 
+        # the dict keys double as the set of names seen so far
         if var_name in env_vars_dict:
             raise Exception(f"Environment variable '{var_name}' is duplicated. Please only include it once.")
 
-        if not re.match(r"[0-9a-zA-Z_]+", var_name):
+        if not _ENV_VARIABLE_NAME_RE.fullmatch(var_name):
             raise ValueError(
                 f"Environment variable '{var_name}' is not a valid name. It is only allowed to contain digits 0-9, "
                 f"letters A-Z, a-z and _ (underscore)."
@@ -252,10 +257,19 @@ def _is_valid_release(release):
     return True
 
 
+def _newer_version_ttl_hash() -> int:
+    """Returns a value that changes every ``_NEWER_VERSION_TTL`` seconds, used to expire the cached PyPI check."""
+    return int(time.monotonic() // _NEWER_VERSION_TTL)
+
+
 @functools.lru_cache(maxsize=1)
-def _get_newer_version() -> Optional[str]:
+def _get_newer_version(ttl_hash: Optional[int] = None) -> Optional[str]:
     """Check PyPI for newer versions of ``lightning``, returning the newest version if different from the current
-    or ``None`` otherwise."""
+    or ``None`` otherwise.
+
+    Args:
+        ttl_hash: Only used as the cache key, pass :func:`_newer_version_ttl_hash` to refresh the result periodically.
+    """
     if packaging.version.parse(__version__).is_prerelease:
         return None
     try:
@@ -290,7 +304,7 @@ def _check_version_and_upgrade():
 
     If not, prompt the user to upgrade ``lightning`` for them and re-run the current call in the new version.
     """
-    new_version = _get_newer_version()
+    new_version = _get_newer_version(_newer_version_ttl_hash())
     if new_version:
         prompt = f"A newer version of {__package_name__} is available ({new_version}). Would you like to upgrade?"
 
@@ -1,17 +1,16 @@
 import os
 import shutil
-import signal
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
 from threading import Thread
+from typing import Union
 
 import psutil
 import py
 import pytest
 
-from lightning_app.storage.path import _storage_root_dir
-from lightning_app.utilities.app_helpers import _collect_child_process_pids
+from lightning_app.storage.path import _storage_root_path
 from lightning_app.utilities.component import _set_context
 from lightning_app.utilities.packaging import cloud_compute
 from lightning_app.utilities.packaging.app_config import _APP_CONFIG_FILENAME
@@ -19,6 +18,9 @@ from lightning_app.utilities.state import AppState
 
 os.environ["LIGHTNING_DISPATCHED"] = "1"
 
+# cap every join, including the bare ones in the app utilities and the interpreter-exit joins, so that a stuck
+# thread can't hang the test run. the cap also replaces any explicit timeout, e.g. `join(0)` still waits up to 1s,
+# which is why `pytest_sessionfinish` calls `original_method` to apply its own deadline
 original_method = Thread._wait_for_tstate_lock
 
 
@@ -34,26 +36,38 @@ def pytest_sessionfinish(session, exitstatus):
     system."""
     # kill all the processes and threads created by parent
     # TODO this isn't great. We should have each tests doing it's own cleanup
+    # a single sweep over the descendants is enough: the resource trackers skipped below ignore SIGTERM anyway
     current_process = psutil.Process()
+    killed = []
     for child in current_process.children(recursive=True):
         try:
-            params = child.as_dict() or {}
-            cmd_lines = params.get("cmdline", [])
+            # only fetch the command line, querying all the process attributes is expensive
+            params = child.as_dict(attrs=["cmdline"]) or {}
+            cmd_lines = params.get("cmdline") or []
             # we shouldn't kill the resource tracker from multiprocessing. If we do,
             # `atexit` will throw as it uses resource tracker to try to clean up
             if cmd_lines and "resource_tracker" in cmd_lines[-1]:
                 continue
             child.kill()
+            killed.append(child)
         except psutil.NoSuchProcess:
             pass
+    psutil.wait_procs(killed, timeout=0)
 
+    # the joins share a bounded budget so that lingering threads can't block the session from finishing. they go
+    # through `original_method` because the patched one would wait the full second for every thread. it returns
+    # right away for threads that already finished, whereas `is_alive()` would raise with the patched method
     main_thread = threading.current_thread()
+    deadline = time.monotonic() + 1
     for t in threading.enumerate():
         if t is not main_thread:
-            t.join(0)
+            original_method(t, timeout=max(deadline - time.monotonic(), 0))
 
-    for child_pid in _collect_child_process_pids(os.getpid()):
-        os.kill(child_pid, signal.SIGTERM)
+
+def _rmtree_if_exists(path: Union[str, Path]) -> None:
+    # most tests don't create any storage, skip the walk in that case
+    if os.path.lexists(path):
+        shutil.rmtree(path, ignore_errors=True)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -62,9 +76,10 @@ def cleanup():
 
     yield
     _LightningAppRef._app_instance = None
-    shutil.rmtree("./storage", ignore_errors=True)
-    shutil.rmtree(_storage_root_dir(), ignore_errors=True)
-    shutil.rmtree("./.shared", ignore_errors=True)
+    _rmtree_if_exists("./storage")
+    # `_storage_root_dir()` would create the directory just to remove it
+    _rmtree_if_exists(_storage_root_path())
+    _rmtree_if_exists("./.shared")
     if os.path.isfile(_APP_CONFIG_FILENAME):
         os.remove(_APP_CONFIG_FILENAME)
     _set_context(None)
@@ -85,33 +100,40 @@ def clear_app_state_state_variables():
 
 @pytest.fixture
 def another_tmpdir(tmp_path: Path) -> py.path.local:
-    random_dir = datetime.now().strftime("%m-%d-%Y-%H-%M-%S")
+    random_dir = f"{time.monotonic_ns():x}"
     tmp_path = os.path.join(tmp_path, random_dir)
     return py.path.local(tmp_path)
 
 
+@pytest.fixture(scope="session")
+def lightning_app_loggers():
+    """The ``lightning_app`` loggers, collected once per session.
+
+    The package logger, the only one that disables propagation, is created on import, before the session starts.
+    """
+    import logging
+
+    return [logging.getLogger(name) for name in logging.root.manager.loggerDict if name.startswith("lightning_app")]
+
+
 @pytest.fixture
-def caplog(caplog):
+def caplog(caplog, lightning_app_loggers):
     """Workaround for https://github.com/pytest-dev/pytest/issues/3697.
 
     Setting ``filterwarnings`` with pytest breaks ``caplog`` when ``not logger.propagate``.
     """
     import logging
 
-    root_logger = logging.getLogger()
+    root_logger = logging.root
     root_propagate = root_logger.propagate
     root_logger.propagate = True
 
-    propagation_dict = {
-        name: logging.getLogger(name).propagate
-        for name in logging.root.manager.loggerDict
-        if name.startswith("lightning_app")
-    }
-    for name in propagation_dict.keys():
-        logging.getLogger(name).propagate = True
+    propagations = [logger.propagate for logger in lightning_app_loggers]
+    for logger in lightning_app_loggers:
+        logger.propagate = True
 
     yield caplog
 
     root_logger.propagate = root_propagate
-    for name, propagate in propagation_dict.items():
-        logging.getLogger(name).propagate = propagate
+    for logger, propagate in zip(lightning_app_loggers, propagations):
+        logger.propagate = propagate
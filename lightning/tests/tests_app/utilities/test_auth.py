@@ -9,6 +9,11 @@ from lightning_app.utilities.auth import _credential_string_to_basic_auth_params
     "credential_string, expected_parsed, exception_message",
     [
         ("", None, "Credential string must follow the format username:password; the provided one ('') does not."),
+        (
+            "user:pass:word",
+            None,
+            "Credential string must follow the format username:password; the provided one ('user:pass:word') does not.",
+        ),
         (":", None, "Username cannot be empty."),
         (":pass", None, "Username cannot be empty."),
         ("user:", None, "Password cannot be empty."),
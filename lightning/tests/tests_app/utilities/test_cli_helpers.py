@@ -31,6 +31,9 @@ def test_format_input_env_variables():
     ):
         _format_input_env_variables(("*FOO#=bar",))
 
+    with pytest.raises(ValueError, match="is not a valid name"):
+        _format_input_env_variables(("FOO#=bar",))
+
     assert _format_input_env_variables(("FOO=bar", "BLA=bloz")) == {"FOO": "bar", "BLA": "bloz"}
 
 
@@ -111,3 +114,19 @@ def test_get_newer_version(mock_requests, releases, current_version, newer_versi
 
     _get_newer_version.cache_clear()
     assert _get_newer_version() == newer_version
+
+
+@patch("lightning_app.utilities.cli_helpers.requests")
+def test_get_newer_version_ttl_hash(mock_requests):
+    mock_requests.get().json.return_value = {"releases": {}}
+    mock_requests.get.reset_mock()
+    lightning_app.utilities.cli_helpers.__version__ = "1.0.0"
+
+    _get_newer_version.cache_clear()
+    _get_newer_version(0)
+    _get_newer_version(0)
+    assert mock_requests.get.call_count == 1
+
+    # a new TTL period checks PyPI again
+    _get_newer_version(1)
+    assert mock_requests.get.call_count == 2
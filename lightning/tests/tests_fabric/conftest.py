@@ -68,6 +68,16 @@ def teardown_process_group():
         torch.distributed.destroy_process_group()
 
 
+@pytest.fixture(scope="session")
+def cuda_device() -> torch.device:
+    """Initializes CUDA once per session, so the context creation isn't paid by whichever test comes first."""
+    if not torch.cuda.is_available():
+        pytest.skip("Requires CUDA")
+    torch.cuda.init()
+    torch.zeros(1, device="cuda")
+    return torch.device("cuda", 0)
+
+
 @pytest.fixture
 def reset_deterministic_algorithm():
     """Ensures that torch determinism settings are reset before the next test runs."""
@@ -19,16 +19,22 @@ import torch
 from lightning_fabric.plugins.precision.amp import MixedPrecision
 
 
-def test_amp_precision_default_scaler():
-    precision = MixedPrecision(precision=16, device=Mock())
+@pytest.fixture(scope="session")
+def mock_device():
+    # the plugin only stores the device, so the same mock can be shared by all tests
+    return Mock()
+
+
+def test_amp_precision_default_scaler(mock_device):
+    precision = MixedPrecision(precision=16, device=mock_device)
     assert isinstance(precision.scaler, torch.cuda.amp.GradScaler)
 
 
-def test_amp_precision_scaler_with_bf16():
+def test_amp_precision_scaler_with_bf16(mock_device):
     with pytest.raises(ValueError, match="`precision='bf16'` does not use a scaler"):
-        MixedPrecision(precision="bf16", device=Mock(), scaler=Mock())
+        MixedPrecision(precision="bf16", device=mock_device, scaler=Mock())
 
-    precision = MixedPrecision(precision="bf16", device=Mock())
+    precision = MixedPrecision(precision="bf16", device=mock_device)
     assert precision.scaler is None
 
 
@@ -21,6 +21,8 @@ from torch.utils.data import DistributedSampler
 from torch.utils.data.dataloader import DataLoader
 
 from lightning_fabric.fabric import Fabric
+from lightning_fabric.plugins import Precision
+from lightning_fabric.strategies import Strategy
 from lightning_fabric.utilities.device_dtype_mixin import _DeviceDtypeModuleMixin
 from lightning_fabric.wrappers import _FabricDataLoader, _FabricModule, _FabricOptimizer
 
@@ -33,35 +35,38 @@ class EmptyFabric(Fabric):
 def test_fabric_module_wraps():
     """Test that the wrapped module is accessible via the property."""
     module = Mock()
-    assert _FabricModule(module, Mock()).module is module
+    assert _FabricModule(module, Mock(spec_set=Precision)).module is module
 
     wrapped_module = Mock()
     original_module = Mock()
-    assert _FabricModule(wrapped_module, Mock(), original_module=original_module).module is original_module
+    assert (
+        _FabricModule(wrapped_module, Mock(spec_set=Precision), original_module=original_module).module
+        is original_module
+    )
 
 
-def test_fabric_module_attribute_lookup():
-    """Test that attribute lookup passes through to the original module when possible."""
+class OriginalModule(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.layer = torch.nn.Linear(2, 3)
+        self.attribute = 1
 
-    class OriginalModule(torch.nn.Module):
-        def __init__(self):
-            super().__init__()
-            self.layer = torch.nn.Linear(2, 3)
-            self.attribute = 1
+    def method(self):
+        return 2
 
-        def method(self):
-            return 2
 
-    original_module = OriginalModule()
+class ModuleWrapper(torch.nn.Module):
+    def __init__(self, module):
+        super().__init__()
+        self.wrapped = module
 
-    class ModuleWrapper(torch.nn.Module):
-        def __init__(self):
-            super().__init__()
-            self.wrapped = original_module
 
-    wrapped_module = ModuleWrapper()
+def test_fabric_module_attribute_lookup():
+    """Test that attribute lookup passes through to the original module when possible."""
+    original_module = OriginalModule()
+    wrapped_module = ModuleWrapper(original_module)
 
-    fabric_module = _FabricModule(wrapped_module, Mock(), original_module=original_module)
+    fabric_module = _FabricModule(wrapped_module, Mock(spec_set=Precision), original_module=original_module)
     assert fabric_module.attribute == 1
     assert fabric_module.layer is original_module.layer
     assert fabric_module.method() == 2
@@ -73,72 +78,57 @@ def test_fabric_module_attribute_lookup():
 
 def test_fabric_module_state_dict_access():
     """Test that state_dict access passes through to the original module."""
-
-    class OriginalModule(torch.nn.Module):
-        def __init__(self):
-            super().__init__()
-            self.layer = torch.nn.Linear(2, 3)
-
     original_module = OriginalModule()
+    wrapped_module = ModuleWrapper(original_module)
 
-    class ModuleWrapper(torch.nn.Module):
-        def __init__(self):
-            super().__init__()
-            self.wrapped = original_module
-
-    wrapped_module = ModuleWrapper()
-
-    fabric_module = _FabricModule(wrapped_module, Mock(), original_module=original_module)
+    fabric_module = _FabricModule(wrapped_module, Mock(spec_set=Precision), original_module=original_module)
     state_dict = fabric_module.state_dict()
     assert set(state_dict.keys()) == {"layer.weight", "layer.bias"}
 
-    weight, bias = torch.rand(3, 2), torch.rand(3)
+    weight, bias = torch.arange(6.0).view(3, 2), torch.arange(3.0)
     fabric_module.load_state_dict({"layer.weight": weight, "layer.bias": bias})
     assert torch.equal(fabric_module.layer.weight, weight)
     assert torch.equal(fabric_module.layer.bias, bias)
 
 
+# the `fabric_env` params are shared objects as pytest reuses the fixture instance only for the identical param
+_FP32_CUDA = (32, "gpu", "cuda:0")
+_FP16_CUDA = (16, "gpu", "cuda:0")
+_BF16_CUDA = ("bf16", "gpu", "cuda:0")
+_FP32_MPS = (32, "mps", "mps:0")
+
+
+@pytest.fixture(scope="session")
+def fabric_env(request):
+    """Creates the Fabric once per ``(precision, accelerator, device)`` combination."""
+    precision, accelerator, device_str = request.param
+    if device_str.startswith("cuda"):
+        request.getfixturevalue("cuda_device")
+    fabric = EmptyFabric(precision=precision, accelerator=accelerator, devices=1)
+    yield precision, fabric, torch.device(device_str)
+    torch.clear_autocast_cache()
+
+
 @pytest.mark.parametrize(
-    "precision, input_type, expected_type, accelerator, device_str",
+    "fabric_env, input_type, expected_type",
     [
-        pytest.param(32, torch.float16, torch.float32, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(32, torch.float32, torch.float32, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(32, torch.float64, torch.float32, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(32, torch.int, torch.int, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(16, torch.float32, torch.float16, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(16, torch.float64, torch.float16, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(16, torch.long, torch.long, "gpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
-        pytest.param(
-            "bf16",
-            torch.float32,
-            torch.bfloat16,
-            "gpu",
-            "cuda:0",
-            marks=RunIf(min_cuda_gpus=1, bf16_cuda=True),
-        ),
-        pytest.param(
-            "bf16",
-            torch.float64,
-            torch.bfloat16,
-            "gpu",
-            "cuda:0",
-            marks=RunIf(min_cuda_gpus=1, bf16_cuda=True),
-        ),
-        pytest.param(
-            "bf16",
-            torch.bool,
-            torch.bool,
-            "gpu",
-            "cuda:0",
-            marks=RunIf(min_cuda_gpus=1, bf16_cuda=True),
-        ),
-        pytest.param(32, torch.float32, torch.float32, "mps", "mps:0", marks=RunIf(mps=True)),
+        pytest.param(_FP32_CUDA, torch.float16, torch.float32, marks=RunIf(min_cuda_gpus=1)),
+        pytest.param(_FP32_CUDA, torch.float32, torch.float32, marks=RunIf(min_cuda_gpus=1)),
+        pytest.param(_FP32_CUDA, torch.int, torch.int, marks=RunIf(min_cuda_gpus=1)),
+        pytest.param(_FP16_CUDA, torch.float32, torch.float16, marks=RunIf(min_cuda_gpus=1)),
+        pytest.param(_FP16_CUDA, torch.long, torch.long, marks=RunIf(min_cuda_gpus=1)),
+        pytest.param(_BF16_CUDA, torch.float32, torch.bfloat16, marks=RunIf(min_cuda_gpus=1, bf16_cuda=True)),
+        pytest.param(_BF16_CUDA, torch.float64, torch.bfloat16, marks=RunIf(min_cuda_gpus=1, bf16_cuda=True)),
+        pytest.param(_BF16_CUDA, torch.bool, torch.bool, marks=RunIf(min_cuda_gpus=1, bf16_cuda=True)),
+        pytest.param(_FP32_MPS, torch.float32, torch.float32, marks=RunIf(mps=True)),
     ],
+    indirect=["fabric_env"],
+    # a session scope is needed for the `fabric_env` instances not to be torn down after every test
+    scope="session",
 )
-def test_fabric_module_forward_conversion(precision, input_type, expected_type, accelerator, device_str):
+def test_fabric_module_forward_conversion(fabric_env, input_type, expected_type):
     """Test that the FabricModule performs autocasting on the input tensors and during forward()."""
-    fabric = EmptyFabric(precision=precision, accelerator=accelerator, devices=1)
-    device = torch.device(device_str)
+    precision, fabric, device = fabric_env
 
     def check_autocast(forward_input):
         assert precision != 16 or torch.is_autocast_enabled()
@@ -151,30 +141,35 @@ def test_fabric_module_forward_conversion(precision, input_type, expected_type,
     assert out.dtype == input_type or out.dtype == torch.get_default_dtype()
 
 
+class DeviceModule(_DeviceDtypeModuleMixin):
+    pass
+
+
+@pytest.fixture
+def device(request):
+    """The device for the requested device string, CUDA gets initialized through the ``cuda_device`` fixture."""
+    if request.param.startswith("cuda"):
+        request.getfixturevalue("cuda_device")
+    return torch.device(request.param)
+
+
 @pytest.mark.parametrize(
-    "device_str",
+    "device",
     [
         "cpu",
         pytest.param("cuda:0", marks=RunIf(min_cuda_gpus=1)),
         pytest.param("mps", marks=RunIf(mps=True)),
     ],
+    indirect=True,
 )
 @pytest.mark.parametrize("dtype", [torch.float32, torch.float16])
-def test_fabric_module_device_dtype_propagation(device_str, dtype):
+def test_fabric_module_device_dtype_propagation(device, dtype):
     """Test that the FabricModule propagates device and dtype properties to its submodules (e.g. torchmetrics)."""
-
-    device = torch.device(device_str)
-
-    class DeviceModule(_DeviceDtypeModuleMixin):
-        pass
-
     device_module = DeviceModule()
-    fabric_module = _FabricModule(device_module, Mock())
-    fabric_module.to(device)
+    fabric_module = _FabricModule(device_module, Mock(spec_set=Precision))
+    fabric_module.to(device=device, dtype=dtype)
     assert device_module.device == device
     assert fabric_module.device == device
-
-    fabric_module.to(dtype)
     assert device_module.dtype == dtype
     assert fabric_module.dtype == dtype
 
@@ -186,24 +181,25 @@ def test_fabric_dataloader_iterator():
     fabric_dataloader = _FabricDataLoader(dataloader)
     assert len(fabric_dataloader) == len(dataloader) == 3
 
-    iterator = iter(dataloader)
-    fabric_iterator = iter(fabric_dataloader)
+    # `list()` only returns once the iterator raised `StopIteration`
+    expected = list(dataloader)
+    actual = list(fabric_dataloader)
+    assert len(expected) == len(actual) == 3
+    assert all(torch.equal(a, b) for a, b in zip(expected, actual))
 
-    assert torch.equal(next(iterator), next(fabric_iterator))
-    assert torch.equal(next(iterator), next(fabric_iterator))
-    assert torch.equal(next(iterator), next(fabric_iterator))
 
-    with pytest.raises(StopIteration):
-        next(iterator)
-
-    with pytest.raises(StopIteration):
-        next(fabric_iterator)
+def test_fabric_dataloader_device_placement_cpu():
+    """Test that the FabricDataLoader iterates over tensors and collections when the data stays on the CPU."""
+    dataloader = DataLoader([torch.tensor(0), {"data": torch.tensor(1)}], batch_size=1)
+    fabric_dataloader = _FabricDataLoader(dataloader=dataloader, device=torch.device("cpu"))
+    batch0, batch1 = fabric_dataloader
+    assert torch.equal(batch0, torch.tensor([0]))
+    assert torch.equal(batch1["data"], torch.tensor([1]))
 
 
 @pytest.mark.parametrize(
     "src_device_str, dest_device_str",
     [
-        ("cpu", "cpu"),
         pytest.param("cpu", "cuda:0", marks=RunIf(min_cuda_gpus=1)),
         pytest.param("cuda:0", "cpu", marks=RunIf(min_cuda_gpus=1)),
         # pytest.param("cpu", "mps", marks=RunIf(mps=True)),  # TODO: Add once torch.equal is supported
@@ -232,11 +228,18 @@ def test_fabric_dataloader_device_placement(src_device_str, dest_device_str):
     assert torch.equal(batch1["data"], torch.tensor([2, 3], device=dest_device))
 
 
-def test_fabric_dataloader_distributed_sampler_set_epoch():
-    """Test that the FabricDataLoader calls `set_epoch()` on the wrapped sampler if applicable."""
+@pytest.fixture(scope="module")
+def distributed_sampler_dataloader():
     sampler = DistributedSampler(range(3), num_replicas=2, rank=0)
     sampler.set_epoch = Mock()
-    dataloader = DataLoader(range(3), sampler=sampler)
+    return DataLoader(range(3), sampler=sampler)
+
+
+def test_fabric_dataloader_distributed_sampler_set_epoch(distributed_sampler_dataloader):
+    """Test that the FabricDataLoader calls `set_epoch()` on the wrapped sampler if applicable."""
+    dataloader = distributed_sampler_dataloader
+    # the dataloader is shared within the module, forget the calls from previous runs
+    dataloader.sampler.set_epoch.reset_mock()
     fabric_dataloader = _FabricDataLoader(dataloader)
     iterator_epoch_0 = iter(fabric_dataloader)
     dataloader.sampler.set_epoch.assert_not_called()
@@ -256,7 +259,7 @@ def test_fabric_optimizer_wraps():
     """Test that the FabricOptimizer fully wraps the optimizer."""
     optimizer_cls = torch.optim.SGD
     optimizer = Mock(spec=optimizer_cls)
-    fabric_optimizer = _FabricOptimizer(optimizer, Mock())
+    fabric_optimizer = _FabricOptimizer(optimizer, Mock(spec_set=Strategy))
     assert fabric_optimizer.optimizer is optimizer
     assert isinstance(fabric_optimizer, optimizer_cls)
 
@@ -264,7 +267,7 @@ def test_fabric_optimizer_wraps():
 def test_fabric_optimizer_state_dict():
     """Test that the FabricOptimizer calls into the strategy to collect the state."""
     optimizer = Mock()
-    strategy = Mock()
+    strategy = Mock(spec_set=Strategy)
     fabric_optimizer = _FabricOptimizer(optimizer=optimizer, strategy=strategy)
     fabric_optimizer.state_dict()
     strategy.get_optimizer_state.assert_called_with(optimizer)
@@ -294,13 +297,26 @@ def test_fabric_optimizer_steps():
     strategy.optimizer_step.assert_called_once_with(strategy.model)
 
 
-def test_fabric_optimizer_zero_grad_kwargs():
+class _StubSGD(torch.optim.SGD):
+    """An SGD optimizer without any parameters or state, for tests that only patch its methods."""
+
+    def __init__(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def linear_parameters():
+    # the optimizers in these tests never update the parameters, so they can be shared
+    return list(torch.nn.Linear(1, 1).parameters())
+
+
+def test_fabric_optimizer_zero_grad_kwargs(linear_parameters):
     """Test that Fabric can adapt the `.zero_grad()` arguments to the underlying optimizer."""
 
     # Test PyTorch's standard `.zero_grad()` signature
     with mock.patch("torch.optim.SGD.zero_grad") as zero_grad_mock:
-        optimizer = torch.optim.SGD(torch.nn.Linear(1, 1).parameters(), 0.1)
-        fabric_optimizer = _FabricOptimizer(optimizer=optimizer, strategy=Mock())
+        optimizer = _StubSGD()
+        fabric_optimizer = _FabricOptimizer(optimizer=optimizer, strategy=Mock(spec_set=Strategy))
         fabric_optimizer.zero_grad()
         zero_grad_mock.assert_called_with()
         fabric_optimizer.zero_grad(set_to_none=False)
@@ -315,8 +331,8 @@ def test_fabric_optimizer_zero_grad_kwargs():
         def zero_grad(self, set_grads_to_None=False):
             custom_zero_grad(set_grads_to_None=set_grads_to_None)
 
-    optimizer = CustomSGD(torch.nn.Linear(1, 1).parameters(), 0.1)
-    fabric_optimizer = _FabricOptimizer(optimizer=optimizer, strategy=Mock())
+    optimizer = CustomSGD(linear_parameters, 0.1)
+    fabric_optimizer = _FabricOptimizer(optimizer=optimizer, strategy=Mock(spec_set=Strategy))
     fabric_optimizer.zero_grad()
     custom_zero_grad.assert_called_with(set_grads_to_None=False)
     fabric_optimizer.zero_grad(set_to_none=False)
@@ -24,6 +24,7 @@ import torch.distributed
 
 import lightning_fabric
 import pytorch_lightning
+from lightning_fabric.accelerators.cuda import _device_count_nvml
 from lightning_fabric.plugins.environments.lightning import find_free_network_port
 from lightning_fabric.utilities.imports import _IS_WINDOWS, _TORCH_GREATER_EQUAL_1_12
 from pytorch_lightning.trainer.connectors.signal_connector import SignalConnector
@@ -230,7 +231,9 @@ def tmpdir_server(tmpdir):
 def single_process_pg():
     """Initialize the default process group with only the current process for testing purposes.
 
-    The process group is destroyed when the with block is exited.
+    The process group is destroyed when the with block is exited. It is deliberately function-scoped: the autouse
+    ``teardown_process_group`` fixture destroys any default process group after each test, and many tests rely on
+    none being initialized.
     """
     if torch.distributed.is_initialized():
         raise RuntimeError("Can't use `single_process_pg` when the default process group is already initialized.")
@@ -249,6 +252,38 @@ def single_process_pg():
         os.environ.update(orig_environ)
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    _assign_cuda_devices_to_xdist_worker()
+    # the tests use tiny models for which spinning up the thread pools costs more than the ops themselves. this also
+    # avoids oversubscribing the CPU when the tests are distributed over several workers
+    torch.set_num_threads(1)
+    torch.set_num_interop_threads(1)
+
+
+def _assign_cuda_devices_to_xdist_worker() -> None:
+    """Splits the visible CUDA devices between the pytest-xdist workers when ``PL_RUN_CUDA_TESTS_PARALLEL=1``.
+
+    Each worker (``gw0``, ``gw1``, ...) gets its own slice of the devices through ``CUDA_VISIBLE_DEVICES``, so that
+    tests from different files can run on different GPUs concurrently. This has to happen before
+    :func:`torch.cuda.device_count` caches the number of devices, i.e., before the tests are collected.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker is None or os.getenv("PL_RUN_CUDA_TESTS_PARALLEL", "0") != "1":
+        return
+    visible_devices = os.getenv("CUDA_VISIBLE_DEVICES")
+    if visible_devices is not None:
+        devices = [device for device in visible_devices.split(",") if device]
+    else:
+        devices = [str(i) for i in range(max(_device_count_nvml(), 0))]
+    if not devices:
+        return
+    num_workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    # tests requiring more devices than a worker gets will be skipped by `RunIf(min_cuda_gpus=...)`
+    devices_per_worker = max(1, len(devices) // num_workers)
+    start = int(worker[2:]) * devices_per_worker % len(devices)
+    os.environ["CUDA_VISIBLE_DEVICES"] = ",".join(devices[start : start + devices_per_worker])
+
+
 def pytest_collection_modifyitems(items: List[pytest.Function], config: pytest.Config) -> None:
     initial_size = len(items)
     conditions = []
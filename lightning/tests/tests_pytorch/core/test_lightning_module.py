@@ -13,6 +13,7 @@
 # limitations under the License.
 import sys
 import weakref
+from itertools import chain
 from unittest.mock import Mock
 
 import pytest
@@ -25,7 +26,7 @@ from lightning_fabric.utilities.imports import _TORCH_GREATER_EQUAL_1_11
 from pytorch_lightning import LightningModule, Trainer
 from pytorch_lightning.core.module import _TrainerFabricShim
 from pytorch_lightning.demos.boring_classes import BoringModel
-from pytorch_lightning.loggers import TensorBoardLogger
+from pytorch_lightning.utilities import GradClipAlgorithmType
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _TORCH_GREATER_EQUAL_1_13
 from tests_pytorch.helpers.runif import RunIf
@@ -36,77 +37,89 @@ def test_lightning_module_not_abstract():
     _ = LightningModule()
 
 
-def test_property_current_epoch():
+@pytest.fixture(scope="module")
+def shared_boring_model():
+    return BoringModel()
+
+
+@pytest.fixture
+def boring_model(shared_boring_model):
+    """The module's shared ``BoringModel``, detached from the (mocked) trainer after every test."""
+    yield shared_boring_model
+    shared_boring_model.trainer = None
+
+
+def test_property_current_epoch(boring_model):
     """Test that the current_epoch in LightningModule is accessible via the Trainer."""
-    model = BoringModel()
+    model = boring_model
     assert model.current_epoch == 0
 
-    trainer = Mock(current_epoch=123)
+    trainer = Mock(spec=Trainer, current_epoch=123)
     model.trainer = trainer
     assert model.current_epoch == 123
 
 
-def test_property_global_step():
+def test_property_global_step(boring_model):
     """Test that the global_step in LightningModule is accessible via the Trainer."""
-    model = BoringModel()
+    model = boring_model
     assert model.global_step == 0
 
-    trainer = Mock(global_step=123)
+    trainer = Mock(spec=Trainer, global_step=123)
     model.trainer = trainer
     assert model.global_step == 123
 
 
-def test_property_global_rank():
+def test_property_global_rank(boring_model):
     """Test that the global rank in LightningModule is accessible via the Trainer."""
-    model = BoringModel()
+    model = boring_model
     assert model.global_rank == 0
 
-    trainer = Mock(global_rank=123)
+    trainer = Mock(spec=Trainer, global_rank=123)
     model.trainer = trainer
     assert model.global_rank == 123
 
 
-def test_property_local_rank():
+def test_property_local_rank(boring_model):
     """Test that the local rank in LightningModule is accessible via the Trainer."""
-    model = BoringModel()
+    model = boring_model
     assert model.local_rank == 0
 
-    trainer = Mock(local_rank=123)
+    trainer = Mock(spec=Trainer, local_rank=123)
     model.trainer = trainer
     assert model.local_rank == 123
 
 
-def test_property_logger(tmpdir):
+def test_property_logger(boring_model):
     """Test that the logger in LightningModule is accessible via the Trainer."""
-    model = BoringModel()
+    model = boring_model
     assert model.logger is None
 
-    logger = TensorBoardLogger(tmpdir)
-    trainer = Trainer(logger=logger)
+    logger = Mock()
+    trainer = Mock(spec=Trainer, logger=logger)
     model.trainer = trainer
     assert model.logger == logger
 
 
-def test_property_loggers(tmpdir):
+def test_property_loggers(boring_model):
     """Test that loggers in LightningModule is accessible via the Trainer."""
-    model = BoringModel()
+    model = boring_model
     assert model.loggers == []
 
-    logger = TensorBoardLogger(tmpdir)
-    trainer = Trainer(logger=logger)
+    logger = Mock()
+    trainer = Mock(spec=Trainer, loggers=[logger])
     model.trainer = trainer
     assert model.loggers == [logger]
 
-    logger0 = TensorBoardLogger(tmpdir)
-    logger1 = TensorBoardLogger(tmpdir)
-    trainer = Trainer(logger=[logger0, logger1])
+    logger0 = Mock()
+    logger1 = Mock()
+    trainer = Mock(spec=Trainer, loggers=[logger0, logger1])
     model.trainer = trainer
     assert model.loggers == [logger0, logger1]
 
 
-def test_1_optimizer_toggle_model():
+def test_1_optimizer_toggle_model(boring_model):
     """Test toggle_model runs when only one optimizer is used."""
-    model = BoringModel()
+    model = boring_model
     trainer = Mock()
     model.trainer = trainer
     params = model.parameters()
@@ -121,169 +134,70 @@ def test_1_optimizer_toggle_model():
     assert not model._param_requires_grad_state
 
 
-def test_toggle_untoggle_2_optimizers_no_shared_parameters(tmpdir):
-    class TestModel(BoringModel):
-        def __init__(self):
-            super().__init__()
-            self.automatic_optimization = False
-            self.layer_1 = nn.Sequential(nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32))
-
-            self.layer_2 = nn.Sequential(
-                nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 2)
-            )
-
-            # set some weights to require no gradient to check that toggle/untoggle works as expected.
-            self.layer_1[2].weight.requires_grad = False
-            self.layer_1[4].weight.requires_grad = False
-
-            self.layer_2[1].weight.requires_grad = False
-            self.layer_2[3].weight.requires_grad = False
-
-        def training_step(self, batch, batch_idx):
-            opt1, opt2 = self.optimizers()
-
-            # Use the first optimizer, toggle it
-            self.toggle_optimizer(opt1)
-            loss = self.step(batch)
-            opt1.zero_grad()
-            self.manual_backward(loss)
-            assert self.layer_1[0].weight.requires_grad is True
-            assert self.layer_1[2].weight.requires_grad is False
-            assert self.layer_1[4].weight.requires_grad is False
-
-            assert self.layer_2[1].weight.requires_grad is False
-            assert self.layer_2[3].weight.requires_grad is False
-            assert self.layer_2[5].weight.requires_grad is False
-            opt1.step()
-            self.untoggle_optimizer(opt1)
-
-            # Use the second optimizer, toggle it
-            self.toggle_optimizer(opt2)
-            loss = self.step(batch)
-            opt2.zero_grad()
-            self.manual_backward(loss)
-            assert self.layer_1[0].weight.requires_grad is False
-            assert self.layer_1[2].weight.requires_grad is False
-            assert self.layer_1[4].weight.requires_grad is False
-
-            assert self.layer_2[1].weight.requires_grad is False
-            assert self.layer_2[3].weight.requires_grad is False
-            assert self.layer_2[5].weight.requires_grad is True
-            opt2.step()
-            self.untoggle_optimizer(opt2)
-
-        def configure_optimizers(self):
-            optimizer_1 = SGD(self.layer_1.parameters(), lr=0.1)
-            optimizer_2 = Adam(self.layer_2.parameters(), lr=0.1)
-            return [optimizer_1, optimizer_2]
-
-    model = TestModel()
-    model.training_epoch_end = None
-
-    trainer = Trainer(max_epochs=1, default_root_dir=tmpdir, limit_train_batches=8, limit_val_batches=0)
-    trainer.fit(model)
+class ToggleModel(BoringModel):
+    def __init__(self, shared_parameters: bool):
+        super().__init__()
+        self.shared_parameters = shared_parameters
+        self.layer_1 = nn.Sequential(nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32))
 
+        self.layer_2 = nn.Sequential(
+            nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 2)
+        )
 
-def test_toggle_untoggle_3_optimizers_shared_parameters(tmpdir):
-    class TestModel(BoringModel):
-        def __init__(self):
-            super().__init__()
-            self.automatic_optimization = False
-            self.layer_1 = nn.Sequential(nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32))
+        # set some weights to require no gradient to check that toggle/untoggle works as expected.
+        self.layer_1[2].weight.requires_grad = False
+        self.layer_1[4].weight.requires_grad = False
 
-            self.layer_2 = nn.Sequential(
-                nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 2)
-            )
+        self.layer_2[1].weight.requires_grad = False
+        self.layer_2[3].weight.requires_grad = False
 
+        if shared_parameters:
             self.layer_3 = nn.Sequential(
                 nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 32), nn.ReLU(), nn.Linear(32, 2)
             )
-
-            # set some weights to require no gradient to check that toggle/untoggle works as expected.
-            self.layer_1[2].weight.requires_grad = False
-            self.layer_1[4].weight.requires_grad = False
-
-            self.layer_2[1].weight.requires_grad = False
-            self.layer_2[3].weight.requires_grad = False
-
             self.layer_3[1].weight.requires_grad = False
             self.layer_3[5].weight.requires_grad = False
 
-        def training_step(self, batch, batch_idx):
-            opt1, opt2, opt3 = self.optimizers()
-
-            # Use the first optimizer, toggle it
-            self.toggle_optimizer(opt1)
-            loss = self.step(batch)
-            opt1.zero_grad()
-            self.manual_backward(loss)
-            assert self.layer_1[0].weight.requires_grad is True
-            assert self.layer_1[2].weight.requires_grad is False
-            assert self.layer_1[4].weight.requires_grad is False
-
-            assert self.layer_2[1].weight.requires_grad is False
-            assert self.layer_2[3].weight.requires_grad is False
-            assert self.layer_2[5].weight.requires_grad is True
-
-            assert self.layer_3[1].weight.requires_grad is False
-            assert self.layer_3[3].weight.requires_grad is False
-            assert self.layer_3[5].weight.requires_grad is False
-            opt1.step()
-            self.untoggle_optimizer(opt1)
-
-            # Use the second optimizer, toggle it
-            self.toggle_optimizer(opt2)
-            loss = self.step(batch)
-            opt2.zero_grad()
-            self.manual_backward(loss)
-            assert self.layer_1[0].weight.requires_grad is False
-            assert self.layer_1[2].weight.requires_grad is False
-            assert self.layer_1[4].weight.requires_grad is False
-
-            assert self.layer_2[1].weight.requires_grad is False
-            assert self.layer_2[3].weight.requires_grad is False
-            assert self.layer_2[5].weight.requires_grad is True
-
-            assert self.layer_3[1].weight.requires_grad is False
-            assert self.layer_3[3].weight.requires_grad is True
-            assert self.layer_3[5].weight.requires_grad is False
-            opt2.step()
-            self.untoggle_optimizer(opt2)
-
-            # Use the third optimizer, toggle it
-            self.toggle_optimizer(opt3)
-            loss = self.step(batch)
-            opt3.zero_grad()
-            self.manual_backward(loss)
-            assert self.layer_1[0].weight.requires_grad is True
-            assert self.layer_1[2].weight.requires_grad is False
-            assert self.layer_1[4].weight.requires_grad is False
-
-            assert self.layer_2[1].weight.requires_grad is False
-            assert self.layer_2[3].weight.requires_grad is False
-            assert self.layer_2[5].weight.requires_grad is False
-
-            assert self.layer_3[1].weight.requires_grad is False
-            assert self.layer_3[3].weight.requires_grad is True
-            assert self.layer_3[5].weight.requires_grad is False
-            opt3.step()
-            self.untoggle_optimizer(opt3)
-
-        @staticmethod
-        def combine_generators(gen_1, gen_2):
-            yield from gen_1
-            yield from gen_2
-
-        def configure_optimizers(self):
-            optimizer_1 = SGD(self.combine_generators(self.layer_1.parameters(), self.layer_2.parameters()), lr=0.1)
-            optimizer_2 = Adam(self.combine_generators(self.layer_2.parameters(), self.layer_3.parameters()), lr=0.1)
-            optimizer_3 = SGD(self.combine_generators(self.layer_3.parameters(), self.layer_1.parameters()), lr=0.1)
-            return [optimizer_1, optimizer_2, optimizer_3]
+    def configure_optimizers(self):
+        if not self.shared_parameters:
+            optimizer_1 = SGD(self.layer_1.parameters(), lr=0.1)
+            optimizer_2 = Adam(self.layer_2.parameters(), lr=0.1)
+            return [optimizer_1, optimizer_2]
+        optimizer_1 = SGD(chain(self.layer_1.parameters(), self.layer_2.parameters()), lr=0.1)
+        optimizer_2 = Adam(chain(self.layer_2.parameters(), self.layer_3.parameters()), lr=0.1)
+        optimizer_3 = SGD(chain(self.layer_3.parameters(), self.layer_1.parameters()), lr=0.1)
+        return [optimizer_1, optimizer_2, optimizer_3]
 
-    model = TestModel()
-    model.training_epoch_end = None
-    trainer = Trainer(max_epochs=1, default_root_dir=tmpdir, limit_train_batches=8)
-    trainer.fit(model)
+
+@pytest.mark.parametrize(
+    "shared_parameters, expected_trainable",
+    [
+        # two optimizers, each with its own layer
+        (False, [{"layer_1.0"}, {"layer_2.5"}]),
+        # three optimizers, each layer is shared by two of them
+        (True, [{"layer_1.0", "layer_2.5"}, {"layer_2.5", "layer_3.3"}, {"layer_1.0", "layer_3.3"}]),
+    ],
+)
+def test_toggle_untoggle_optimizers(shared_parameters, expected_trainable):
+    """Test that toggling an optimizer only leaves its own trainable weights requiring gradients, and that
+    untoggling restores the state before the next optimizer gets toggled."""
+    model = ToggleModel(shared_parameters)
+    optimizers = model.configure_optimizers()
+    trainer = Mock(optimizers=optimizers)
+    model.trainer = trainer
+    assert len(optimizers) == len(expected_trainable)
+    requires_grad_before = {name: p.requires_grad for name, p in model.named_parameters()}
+
+    for optimizer, expected in zip(optimizers, expected_trainable):
+        model.toggle_optimizer(optimizer)
+        trainable = {
+            name
+            for name, module in model.named_modules()
+            if name.startswith("layer_") and isinstance(module, nn.Linear) and module.weight.requires_grad
+        }
+        assert trainable == expected
+        model.untoggle_optimizer(optimizer)
+        assert {name: p.requires_grad for name, p in model.named_parameters()} == requires_grad_before
 
 
 @pytest.mark.parametrize(
@@ -337,14 +251,15 @@ def test_sharded_tensor_state_dict(single_process_pg):
     m_0 = BoringModelWithShardedTensor(spec)
     m_0.sharded_tensor.local_shards()[0].tensor.fill_(1)
     name_st = ".sharded_tensor" if _TORCH_GREATER_EQUAL_1_11 and not _TORCH_GREATER_EQUAL_1_13 else "sharded_tensor"
-    assert name_st in m_0.state_dict(), 'Expect "sharded_tensor" to appear in the state dict'
+    state_dict = m_0.state_dict()
+    assert name_st in state_dict, 'Expect "sharded_tensor" to appear in the state dict'
 
     m_1 = BoringModelWithShardedTensor(spec)
     assert not torch.allclose(
         m_1.sharded_tensor.local_shards()[0].tensor, m_0.sharded_tensor.local_shards()[0].tensor
     ), "Expect the shards to be different before `m_1` loading `m_0`'s state dict"
 
-    m_1.load_state_dict(m_0.state_dict(), strict=False)
+    m_1.load_state_dict(state_dict, strict=False)
     assert torch.allclose(
         m_1.sharded_tensor.local_shards()[0].tensor, m_0.sharded_tensor.local_shards()[0].tensor
     ), "Expect the shards to be same after `m_1` loading `m_0`'s state dict"
@@ -359,8 +274,9 @@ def test_lightning_module_configure_gradient_clipping(tmpdir):
         custom_gradient_clip_val = 1e-2
 
         def configure_gradient_clipping(self, optimizer, optimizer_idx, gradient_clip_val, gradient_clip_algorithm):
-            assert gradient_clip_val == self.trainer.gradient_clip_val
-            assert gradient_clip_algorithm == self.trainer.gradient_clip_algorithm
+            # the Trainer forwards its clipping configuration to the hook
+            assert gradient_clip_val == 1e-4
+            assert gradient_clip_algorithm == GradClipAlgorithmType.VALUE
 
             for pg in optimizer.param_groups:
                 for p in pg["params"]:
@@ -368,7 +284,12 @@ def test_lightning_module_configure_gradient_clipping(tmpdir):
 
     model = TestModel()
     trainer = Trainer(
-        default_root_dir=tmpdir, max_epochs=1, limit_train_batches=1, limit_val_batches=0, gradient_clip_val=1e-4
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        gradient_clip_val=1e-4,
+        gradient_clip_algorithm="value",
     )
     trainer.fit(model)
 
@@ -380,7 +301,7 @@ def test_lightning_module_configure_gradient_clipping(tmpdir):
                 assert p.grad.max() <= model.custom_gradient_clip_val
 
 
-def test_lightning_module_configure_gradient_clipping_different_argument_values(tmpdir):
+def test_lightning_module_configure_gradient_clipping_different_argument_values():
     """Test that setting gradient clipping arguments in `Trainer` and cusotmizing gradient clipping inside
     `configure_gradient_clipping` with different values raises an exception."""
 
@@ -391,14 +312,14 @@ def test_lightning_module_configure_gradient_clipping_different_argument_values(
             self.clip_gradients(optimizer, gradient_clip_val=self.custom_gradient_clip_val)
 
     model = TestModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir, max_epochs=1, limit_train_batches=2, limit_val_batches=0, gradient_clip_val=1e-4
-    )
+    trainer = Mock(spec=Trainer, gradient_clip_val=1e-4, gradient_clip_algorithm=None)
+    model.trainer = trainer
+    optimizer = model.configure_optimizers()[0][0]
     with pytest.raises(
         MisconfigurationException,
         match=r"gradient_clip_val=0.0001\)` and have passed `clip_gradients\(gradient_clip_val=0.01",
     ):
-        trainer.fit(model)
+        model.configure_gradient_clipping(optimizer, 0, trainer.gradient_clip_val, trainer.gradient_clip_algorithm)
 
     class TestModel(BoringModel):
         custom_gradient_clip_algorithm = "foo"
@@ -407,36 +328,42 @@ def test_lightning_module_configure_gradient_clipping_different_argument_values(
             self.clip_gradients(optimizer, gradient_clip_algorithm=self.custom_gradient_clip_algorithm)
 
     model = TestModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir,
-        max_epochs=1,
-        limit_train_batches=2,
-        limit_val_batches=0,
-        gradient_clip_algorithm="norm",
-    )
+    trainer = Mock(spec=Trainer, gradient_clip_val=None, gradient_clip_algorithm=GradClipAlgorithmType.NORM)
+    model.trainer = trainer
+    optimizer = model.configure_optimizers()[0][0]
     with pytest.raises(
         MisconfigurationException,
         match=r"gradient_clip_algorithm='norm'\)` and have passed `clip_gradients\(gradient_clip_algorithm='foo'",
     ):
-        trainer.fit(model)
+        model.configure_gradient_clipping(optimizer, 0, trainer.gradient_clip_val, trainer.gradient_clip_algorithm)
+
+
+@pytest.fixture(scope="module")
+def torch_and_lightning_modules():
+    return nn.Module(), LightningModule()
 
 
-def test_proper_refcount():
-    torch_module = nn.Module()
-    lightning_module = LightningModule()
+def test_proper_refcount(torch_and_lightning_modules):
+    torch_module, lightning_module = torch_and_lightning_modules
 
     assert sys.getrefcount(torch_module) == sys.getrefcount(lightning_module)
 
 
-def test_lightning_module_scriptable():
+@pytest.fixture(scope="module")
+def scripted_boring_model():
+    """A ``BoringModel`` attached to a ``Trainer``, compiled with ``torch.jit.script`` once per module."""
+    model = BoringModel()
+    trainer = Trainer()
+    model.trainer = trainer
+    return torch.jit.script(model)
+
+
+def test_lightning_module_scriptable(scripted_boring_model):
     """Test that the LightningModule is `torch.jit.script`-able.
 
     Regression test for #15917.
     """
-    model = BoringModel()
-    trainer = Trainer()
-    model.trainer = trainer
-    torch.jit.script(model)
+    assert isinstance(scripted_boring_model, torch.jit.ScriptModule)
 
 
 def test_trainer_reference_recursively():
@@ -550,11 +477,24 @@ def test_fabric_logger_access():
     assert wrapped_module.loggers == [logger1, logger2]
 
 
-def test_fabric_log():
+@pytest.fixture(scope="module")
+def shared_fabric_module():
     logger = Mock()
-    module = BoringModel()
     fabric = Fabric(loggers=[logger])
-    wrapped_module = fabric.setup(module)
+    # the fabric is only weakly referenced by the module
+    return fabric, fabric.setup(BoringModel()), logger
+
+
+@pytest.fixture
+def fabric_module(shared_fabric_module):
+    """The module's shared ``BoringModel`` set up with a ``Fabric`` that logs to a mocked logger."""
+    _, wrapped_module, logger = shared_fabric_module
+    yield wrapped_module, logger
+    logger.reset_mock()
+
+
+def test_fabric_log(fabric_module):
+    wrapped_module, logger = fabric_module
 
     # unsupported data type
     with pytest.raises(ValueError, match="`list` values cannot be logged"):
@@ -574,11 +514,8 @@ def test_fabric_log():
     logger.log_metrics.assert_not_called()
 
 
-def test_fabric_log_dict():
-    logger = Mock()
-    module = BoringModel()
-    fabric = Fabric(loggers=[logger])
-    wrapped_module = fabric.setup(module)
+def test_fabric_log_dict(fabric_module):
+    wrapped_module, logger = fabric_module
 
     # unsupported data type
     with pytest.raises(ValueError, match="`list` values cannot be logged"):
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
-
 import torch
 
 from lightning_fabric import Fabric
@@ -26,7 +24,7 @@ def test_fabric_boring_lightning_module_automatic():
     fabric = Fabric(accelerator="cpu", devices=1)
 
     module = BoringModel()
-    parameters_before = deepcopy(list(module.parameters()))
+    parameters_before = [p.detach().clone() for p in module.parameters()]
 
     optimizers, _ = module.configure_optimizers()
     dataloader = module.train_dataloader()
@@ -48,7 +46,7 @@ def test_fabric_boring_lightning_module_manual():
     fabric = Fabric(accelerator="cpu", devices=1)
 
     module = ManualOptimBoringModel()
-    parameters_before = deepcopy(list(module.parameters()))
+    parameters_before = [p.detach().clone() for p in module.parameters()]
 
     optimizers, _ = module.configure_optimizers()
     dataloader = module.train_dataloader()
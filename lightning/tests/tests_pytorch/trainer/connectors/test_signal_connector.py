@@ -11,9 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import concurrent.futures
 import os
 import signal
+import threading
 from unittest import mock
 
 import pytest
@@ -21,19 +21,24 @@ import pytest
 from lightning_fabric.plugins.environments import SLURMEnvironment
 from lightning_fabric.utilities.imports import _IS_WINDOWS
 from pytorch_lightning import Trainer
-from pytorch_lightning.demos.boring_classes import BoringModel
+from pytorch_lightning.trainer.connectors import signal_connector
 from pytorch_lightning.trainer.connectors.signal_connector import SignalConnector
-from pytorch_lightning.utilities.exceptions import SIGTERMException
 from tests_pytorch.helpers.runif import RunIf
 
 
+@pytest.fixture(scope="module")
+def slurm_trainer():
+    """A ``Trainer`` with the default ``SLURMEnvironment``, shared by the tests that only attach a
+    ``SignalConnector`` to it."""
+    return Trainer(plugins=SLURMEnvironment())
+
+
 @RunIf(skip_windows=True)
-def test_signal_handlers_restored_in_teardown():
+def test_signal_handlers_restored_in_teardown(slurm_trainer):
     """Test that the SignalConnector restores the previously configured handler on teardown."""
     assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
 
-    trainer = Trainer(plugins=SLURMEnvironment())
-    connector = SignalConnector(trainer)
+    connector = SignalConnector(slurm_trainer)
     connector.register_signal_handlers()
 
     assert signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL
@@ -51,27 +56,30 @@ def test_sigterm_handler_can_be_added(tmpdir):
 
     signal.signal(signal.SIGTERM, handler)
 
-    class TestModel(BoringModel):
-        def training_step(self, batch, batch_idx):
-            os.kill(os.getpid(), signal.SIGTERM)
-
-    model = TestModel()
-    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_train_batches=2, limit_val_batches=0)
+    trainer = Trainer(default_root_dir=tmpdir)
+    connector = trainer._signal_connector
+    connector.register_signal_handlers()
 
     assert not trainer.received_sigterm
     assert not handler_ran
-    with pytest.raises(SIGTERMException):
-        trainer.fit(model)
+    # the loops raising `SIGTERMException` once `received_sigterm` is set is covered by `test_auto_restart.py`
+    signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
     assert trainer.received_sigterm
     assert handler_ran
 
+    connector.teardown()
     # reset the signal to system defaults
     signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
 
 @RunIf(skip_windows=True)
-@pytest.mark.parametrize("auto_requeue", (True, False))
-@pytest.mark.parametrize("requeue_signal", [signal.SIGUSR1, signal.SIGUSR2, signal.SIGHUP] if not _IS_WINDOWS else [])
+@pytest.mark.parametrize(
+    ["auto_requeue", "requeue_signal"],
+    # without auto-requeueing, the requeue signal is never registered so a single one is enough
+    [(True, signal.SIGUSR1), (True, signal.SIGUSR2), (True, signal.SIGHUP), (False, signal.SIGUSR1)]
+    if not _IS_WINDOWS
+    else [],
+)
 def test_auto_requeue_custom_signal_flag(auto_requeue, requeue_signal):
     trainer = Trainer(plugins=[SLURMEnvironment(auto_requeue=auto_requeue, requeue_signal=requeue_signal)])
     connector = SignalConnector(trainer)
@@ -96,28 +104,22 @@ def test_auto_requeue_custom_signal_flag(auto_requeue, requeue_signal):
 
 
 @RunIf(skip_windows=True)
+@pytest.mark.parametrize(
+    "environ, expected_job_id",
+    [
+        ({"SLURM_JOB_ID": "12345"}, "12345"),
+        ({"SLURM_JOB_ID": "12346", "SLURM_ARRAY_JOB_ID": "12345", "SLURM_ARRAY_TASK_ID": "2"}, "12345_2"),
+    ],
+)
 @mock.patch("pytorch_lightning.trainer.connectors.signal_connector.call")
 @mock.patch("pytorch_lightning.trainer.Trainer.save_checkpoint", mock.MagicMock())
-@mock.patch.dict(os.environ, {"SLURM_JOB_ID": "12345"})
-def test_auto_requeue_job(call_mock):
-    call_mock.return_value = 0
-    trainer = Trainer(plugins=[SLURMEnvironment()])
-    connector = SignalConnector(trainer)
-    connector.slurm_sigusr_handler_fn(None, None)
-    call_mock.assert_called_once_with(["scontrol", "requeue", "12345"])
-    connector.teardown()
-
-
-@RunIf(skip_windows=True)
-@mock.patch("pytorch_lightning.trainer.connectors.signal_connector.call")
-@mock.patch("pytorch_lightning.trainer.Trainer.save_checkpoint", mock.MagicMock())
-@mock.patch.dict(os.environ, {"SLURM_JOB_ID": "12346", "SLURM_ARRAY_JOB_ID": "12345", "SLURM_ARRAY_TASK_ID": "2"})
-def test_auto_requeue_array_job(call_mock):
+def test_auto_requeue_job(call_mock, slurm_trainer, environ, expected_job_id):
+    """Test that the SLURM job, or the task of an array job, is requeued on the requeue signal."""
     call_mock.return_value = 0
-    trainer = Trainer(plugins=[SLURMEnvironment()])
-    connector = SignalConnector(trainer)
-    connector.slurm_sigusr_handler_fn(None, None)
-    call_mock.assert_called_once_with(["scontrol", "requeue", "12345_2"])
+    with mock.patch.dict(os.environ, environ):
+        connector = SignalConnector(slurm_trainer)
+        connector.slurm_sigusr_handler_fn(None, None)
+    call_mock.assert_called_once_with(["scontrol", "requeue", expected_job_id])
     connector.teardown()
 
 
@@ -128,9 +130,18 @@ def _registering_signals():
 
 @RunIf(skip_windows=True)
 def test_signal_connector_in_thread():
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        for future in concurrent.futures.as_completed([executor.submit(_registering_signals)]):
-            assert future.exception() is None
+    exceptions = []
+
+    def run():
+        try:
+            _registering_signals()
+        except BaseException as ex:
+            exceptions.append(ex)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert not exceptions
 
 
 def signal_handler():
@@ -152,7 +163,7 @@ class SignalHandlers:
         (SignalHandlers().signal_handler, True),
     ],
 )
-def test_has_already_handler(handler, expected_return):
+def test_has_already_handler(monkeypatch, handler, expected_return):
     """Test that the SignalConnector detects whether a signal handler is already attached."""
-    with mock.patch("pytorch_lightning.trainer.connectors.signal_connector.signal.getsignal", return_value=handler):
-        assert SignalConnector._has_already_handler(signal.SIGTERM) is expected_return
+    monkeypatch.setattr(signal_connector.signal, "getsignal", lambda _: handler)
+    assert SignalConnector._has_already_handler(signal.SIGTERM) is expected_return
@@ -18,6 +18,8 @@ import pytorch_lightning as pl
 from lightning_fabric.utilities.warnings import PossibleUserWarning
 from pytorch_lightning import LightningDataModule, LightningModule, Trainer
 from pytorch_lightning.demos.boring_classes import BoringModel, RandomDataset
+from pytorch_lightning.trainer.configuration_validator import verify_loop_configurations
+from pytorch_lightning.trainer.states import TrainerFn
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests_pytorch.conftest import mock_cuda_count
 
@@ -42,21 +44,26 @@ def test_wrong_configure_optimizers(tmpdir):
         trainer.fit(model)
 
 
-def test_fit_val_loop_config(tmpdir):
+@pytest.mark.parametrize(
+    "disabled_hook, category, match",
+    [
+        # no val data has val loop
+        ("validation_step", UserWarning, r"You passed in a `val_dataloader` but have no `validation_step`"),
+        # has val loop but no val data
+        ("val_dataloader", PossibleUserWarning, r"You defined a `validation_step` but have no `val_dataloader`"),
+    ],
+)
+def test_fit_val_loop_config(tmpdir, disabled_hook, category, match):
     """When either val loop or val data are missing raise warning."""
     trainer = Trainer(default_root_dir=tmpdir, max_epochs=1)
+    model = BoringModel()
+    setattr(model, disabled_hook, None)
+    trainer._data_connector.attach_data(model)
+    trainer.strategy.connect(model)
+    trainer.state.fn = TrainerFn.FITTING
 
-    # no val data has val loop
-    with pytest.warns(UserWarning, match=r"You passed in a `val_dataloader` but have no `validation_step`"):
-        model = BoringModel()
-        model.validation_step = None
-        trainer.fit(model)
-
-    # has val loop but no val data
-    with pytest.warns(PossibleUserWarning, match=r"You defined a `validation_step` but have no `val_dataloader`"):
-        model = BoringModel()
-        model.val_dataloader = None
-        trainer.fit(model)
+    with pytest.warns(category, match=match):
+        verify_loop_configurations(trainer)
 
 
 def test_eval_loop_config(tmpdir):
@@ -135,17 +142,28 @@ def test_trainer_manual_optimization_config():
         trainer.fit(model)
 
 
-@pytest.mark.parametrize("trainer_kwargs", [{"accelerator": "ipu"}, {"accelerator": "gpu", "strategy": "dp"}])
+@pytest.fixture
+def trainer_kwargs(request, monkeypatch):
+    """Makes the accelerator requested through the ``trainer_kwargs`` parametrization appear available."""
+    kwargs = request.param
+    if kwargs["accelerator"] == "gpu":
+        mock_cuda_count(monkeypatch, 2)
+    elif kwargs["accelerator"] == "ipu":
+        monkeypatch.setattr(pl.accelerators.ipu.IPUAccelerator, "is_available", lambda: True)
+        monkeypatch.setattr(pl.strategies.ipu, "_IPU_AVAILABLE", lambda: True)
+    return kwargs
+
+
+@pytest.mark.parametrize(
+    "trainer_kwargs", [{"accelerator": "ipu"}, {"accelerator": "gpu", "strategy": "dp"}], indirect=True
+)
 @pytest.mark.parametrize("hook", ["transfer_batch_to_device", "on_after_batch_transfer"])
-def test_raise_exception_with_batch_transfer_hooks(monkeypatch, hook, trainer_kwargs, tmpdir):
+def test_raise_exception_with_batch_transfer_hooks(hook, trainer_kwargs, tmpdir):
     """Test that an exception is raised when overriding batch_transfer_hooks."""
-    if trainer_kwargs.get("accelerator") == "gpu":
+    if trainer_kwargs["accelerator"] == "gpu":
         match_pattern = rf"Overriding `{hook}` is not .* in DP mode."
-        mock_cuda_count(monkeypatch, 2)
-    elif trainer_kwargs.get("accelerator") == "ipu":
+    else:
         match_pattern = rf"Overriding `{hook}` is not .* with IPUs"
-        monkeypatch.setattr(pl.accelerators.ipu.IPUAccelerator, "is_available", lambda: True)
-        monkeypatch.setattr(pl.strategies.ipu, "_IPU_AVAILABLE", lambda: True)
 
     def custom_method(self, batch, *_, **__):
         batch = batch + 1
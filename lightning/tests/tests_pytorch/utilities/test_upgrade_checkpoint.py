@@ -21,24 +21,26 @@ import pytest
 from pytorch_lightning.utilities.upgrade_checkpoint import main as upgrade_main
 
 
-def test_upgrade_checkpoint_file_missing(tmp_path, caplog):
-    # path to single file (missing)
+@pytest.mark.parametrize(
+    "checkpoint_exists, extra_args, expected",
+    [
+        # path to single file (missing)
+        (False, [], "The path {path} does not exist"),
+        # path to non-empty directory, but no checkpoints with matching extension
+        (True, ["--extension", ".other"], "No checkpoint files with extension .other were found"),
+    ],
+)
+def test_upgrade_checkpoint_file_missing(tmp_path, caplog, checkpoint_exists, extra_args, expected):
     file = tmp_path / "checkpoint.ckpt"
-    with mock.patch("sys.argv", ["upgrade_checkpoint.py", str(file)]):
-        with caplog.at_level(logging.ERROR):
-            with pytest.raises(SystemExit):
-                upgrade_main()
-            assert f"The path {file} does not exist" in caplog.text
-
-    caplog.clear()
-
-    # path to non-empty directory, but no checkpoints with matching extension
-    file.touch()
-    with mock.patch("sys.argv", ["upgrade_checkpoint.py", str(tmp_path), "--extension", ".other"]):
+    path = file
+    if checkpoint_exists:
+        file.touch()
+        path = tmp_path
+    with mock.patch("sys.argv", ["upgrade_checkpoint.py", str(path)] + extra_args):
         with caplog.at_level(logging.ERROR):
             with pytest.raises(SystemExit):
                 upgrade_main()
-            assert "No checkpoint files with extension .other were found" in caplog.text
+            assert expected.format(path=path) in caplog.text
 
 
 @mock.patch("pytorch_lightning.utilities.upgrade_checkpoint.torch.save")
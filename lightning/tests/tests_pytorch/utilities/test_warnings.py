@@ -33,7 +33,7 @@ if __name__ == "__main__":
     assert isinstance(handler, logging.StreamHandler)
     stderr = StringIO()
     # necessary with `propagate = False`
-    lightning_logger.handlers[0].stream = stderr
+    handler.setStream(stderr)
 
     # necessary with `propagate = True`
     with redirect_stderr(stderr):
@@ -45,17 +45,19 @@ if __name__ == "__main__":
         # level is set to INFO
         lightning_logger.debug("test3")
 
-    output = stderr.getvalue()
-    assert output == "test2\n", repr(output)
+        output = stderr.getvalue()
+        assert output == "test2\n", repr(output)
+
+        # reuse the same stream for the next check
+        stderr.seek(0)
+        stderr.truncate()
 
-    stderr = StringIO()
-    lightning_logger.handlers[0].stream = stderr
-    with redirect_stderr(stderr):
         # Lightning should not output DETAIL level logging by default
         lightning_logger.detail("test1")
         lightning_logger.setLevel(_DETAIL)
         lightning_logger.detail("test2")
         # logger should not output anything for DEBUG statements if set to DETAIL
         lightning_logger.debug("test3")
+
     output = stderr.getvalue()
     assert output == "test2\n", repr(output)